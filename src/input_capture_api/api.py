@@ -1,30 +1,82 @@
 """FastAPI application for HID recording control."""
 
-from typing import Any
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Annotated, Any, Literal
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
 from hid_recorder import EventItem, Session
-from pydantic import BaseModel
+from pydantic import AfterValidator, BaseModel, ConfigDict
 
 from input_capture_api.session_manager import SessionManager
 
 _SESSION_MANAGER_NOT_CONFIGURED = "SessionManager not configured"
+# Responses smaller than this (in bytes) are sent uncompressed
+_GZIP_MINIMUM_SIZE = 1024
+# Streamed NDJSON lines are grouped into body chunks of about this many bytes
+_NDJSON_CHUNK_SIZE = 64 * 1024
+# Session IDs are ULIDs: 26 Crockford base32 characters, first one at most "7"
+_ULID_LENGTH = 26
+_ULID_MAX_FIRST_CHAR = "7"
+_ULID_ALPHABET_DELETE_TABLE = str.maketrans("", "", "0123456789ABCDEFGHJKMNPQRSTVWXYZ")
+# Strict, immutable config shared by request bodies
+_REQUEST_MODEL_CONFIG = ConfigDict(
+    extra="forbid",
+    frozen=True,
+    str_strip_whitespace=False,
+    validate_default=False,
+)
+
+
+def _validate_session_id(session_id: str) -> str:
+    """Check that a session ID is a canonical ULID string without decoding it.
+
+    Args:
+        session_id: Session ID from the request path
+
+    Returns:
+        The unchanged session ID
+
+    Raises:
+        ValueError: If the session ID is not a canonical ULID string
+    """
+    if (
+        len(session_id) != _ULID_LENGTH
+        or session_id[0] > _ULID_MAX_FIRST_CHAR
+        or session_id.translate(_ULID_ALPHABET_DELETE_TABLE)
+    ):
+        msg = f"Invalid session ID: {session_id}"
+        raise ValueError(msg)
+    return session_id
+
+
+SessionId = Annotated[str, AfterValidator(_validate_session_id)]
 
 
 class SessionCreateRequest(BaseModel):
     """Request model for creating a session."""
 
+    model_config = _REQUEST_MODEL_CONFIG
+
     name: str
     metadata: dict[str, Any] | None = None
 
 
-SessionResponse = Session
+class SessionResponse(BaseModel):
+    """Response model for a session."""
+
+    id: str
+    name: str
 
 
 class SessionStatusUpdate(BaseModel):
     """Request model for updating session status."""
 
-    status: str
+    model_config = _REQUEST_MODEL_CONFIG
+
+    status: Literal["ended"]
 
 
 class SessionEndResponse(BaseModel):
@@ -33,10 +85,23 @@ class SessionEndResponse(BaseModel):
     status: str
 
 
+class EventResponse(BaseModel):
+    """Response model for a single event."""
+
+    device: str
+    code: int
+    value: int
+    timestamp: float
+
+
+# Prebuilt body for the common case of polling a session with no events yet
+_EMPTY_EVENTS_BODY = b'{"events":[]}'
+
+
 class EventsResponse(BaseModel):
     """Response model for events list."""
 
-    events: list[EventItem]
+    events: list[EventResponse]
 
 
 class SessionsResponse(BaseModel):
@@ -45,37 +110,151 @@ class SessionsResponse(BaseModel):
     sessions: list[SessionResponse]
 
 
-def _check_session_manager(manager: SessionManager | None) -> SessionManager:
-    """Check if session manager is configured.
+def _json_response(content: object, status_code: int = 200) -> Response:
+    """Render a JSON response with orjson.
 
     Args:
-        manager: SessionManager instance or None
+        content: JSON-serializable content
+        status_code: HTTP status code
 
     Returns:
-        SessionManager instance
+        JSON response
+    """
+    return Response(
+        content=orjson.dumps(content),
+        status_code=status_code,
+        media_type="application/json",
+    )
 
-    Raises:
-        HTTPException: If session manager is not configured
+
+def _new_app() -> FastAPI:
+    """Create a bare FastAPI application with the shared settings.
+
+    Returns:
+        FastAPI application without routes
+    """
+    return FastAPI(title="Input Capture API", version="0.1.0")
+
+
+def _create_unconfigured_app() -> FastAPI:
+    """Create an application that fails every request.
+
+    Used when no SessionManager is given, so the check happens once here
+    instead of in every endpoint.
+
+    Returns:
+        FastAPI application responding with 500 to all requests
     """
-    if manager is None:
-        msg = _SESSION_MANAGER_NOT_CONFIGURED
-        raise HTTPException(status_code=500, detail=msg)
-    return manager
+    app = _new_app()
+
+    @app.middleware("http")
+    async def session_manager_not_configured(
+        _request: Request, _call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        """Reject the request because no SessionManager is configured.
+
+        Returns:
+            Error response
+        """
+        return _json_response(
+            {"detail": _SESSION_MANAGER_NOT_CONFIGURED}, status_code=500
+        )
+
+    return app
+
+
+def _session_to_dict(manager: SessionManager, session: Session) -> dict[str, str]:
+    """Convert a session into its response payload.
+
+    Args:
+        manager: SessionManager used to format the session ID
+        session: Session object
+
+    Returns:
+        Dictionary matching SessionResponse
+    """
+    return {"id": manager.session_id_str(session), "name": session.name}
+
+
+def _event_to_dict(event: EventItem) -> dict[str, Any]:
+    """Convert an event into its response payload.
+
+    Args:
+        event: Event object
+
+    Returns:
+        Dictionary matching EventResponse
+    """
+    return {
+        "device": event.device,
+        "code": event.code,
+        "value": event.value,
+        "timestamp": event.timestamp,
+    }
+
+
+def _events_response(events: list[EventItem]) -> Response:
+    """Build the JSON response for a list of events.
+
+    Args:
+        events: Events of a session
+
+    Returns:
+        Response matching EventsResponse
+    """
+    if not events:
+        return Response(content=_EMPTY_EVENTS_BODY, media_type="application/json")
+    return _json_response({"events": [_event_to_dict(event) for event in events]})
+
+
+async def _ndjson_chunks(events: list[EventItem]) -> AsyncIterator[bytes]:
+    """Serialize events as newline-delimited JSON, grouped into chunks.
+
+    Args:
+        events: Events of a session
+
+    Yields:
+        Chunks of about _NDJSON_CHUNK_SIZE bytes holding whole lines
+    """
+    lines: list[bytes] = []
+    size = 0
+    for event in events:
+        line = orjson.dumps(_event_to_dict(event), option=orjson.OPT_APPEND_NEWLINE)
+        lines.append(line)
+        size += len(line)
+        if size >= _NDJSON_CHUNK_SIZE:
+            yield b"".join(lines)
+            lines = []
+            size = 0
+    if lines:
+        yield b"".join(lines)
 
 
 def create_app(session_manager: SessionManager | None = None) -> FastAPI:
     """Create and configure the FastAPI application.
 
+    Response bodies are built as plain dictionaries and rendered by orjson.
+    The pydantic response models are only referenced for the OpenAPI schema.
+
     Args:
         session_manager: Optional SessionManager instance for dependency injection
 
     Returns:
         Configured FastAPI application
     """
-    app = FastAPI(title="Input Capture API", version="0.1.0")
-
-    @app.post("/sessions")
-    async def start_session(request: SessionCreateRequest) -> SessionResponse:
+    if session_manager is None:
+        return _create_unconfigured_app()
+    manager = session_manager
+
+    app = _new_app()
+    app.add_middleware(GZipMiddleware, minimum_size=_GZIP_MINIMUM_SIZE)
+
+    @app.post(
+        "/sessions",
+        response_model=None,
+        responses={200: {"model": SessionResponse}},
+    )
+    async def start_session(request: SessionCreateRequest) -> Response:
         """Start a new recording session.
 
         Args:
@@ -84,12 +263,12 @@ def create_app(session_manager: SessionManager | None = None) -> FastAPI:
         Returns:
             Session information
         """
-        manager = _check_session_manager(session_manager)
-        return await manager.start_session(request.name, request.metadata)
+        session = await manager.start_session(request.name, request.metadata)
+        return _json_response(_session_to_dict(manager, session))
 
     @app.patch("/sessions/{session_id}")
     async def update_session_status(
-        session_id: str, status_update: SessionStatusUpdate
+        session_id: SessionId, status_update: SessionStatusUpdate
     ) -> SessionEndResponse:
         """Update a recording session status.
 
@@ -101,17 +280,21 @@ def create_app(session_manager: SessionManager | None = None) -> FastAPI:
             Status response
 
         Raises:
-            HTTPException: If status is invalid
+            HTTPException: If no active session has this ID
         """
-        if status_update.status != "ended":
-            msg = f"Invalid status: {status_update.status}. Only 'ended' is supported."
-            raise HTTPException(status_code=400, detail=msg)
-        manager = _check_session_manager(session_manager)
-        await manager.end_session(session_id)
-        return SessionEndResponse(status="ended")
-
-    @app.get("/sessions/{session_id}/events")
-    def get_events(session_id: str) -> EventsResponse:
+        try:
+            await manager.end_session(session_id)
+        except KeyError:
+            msg = f"Active session {session_id} not found"
+            raise HTTPException(status_code=404, detail=msg) from None
+        return SessionEndResponse(status=status_update.status)
+
+    @app.get(
+        "/sessions/{session_id}/events",
+        response_model=None,
+        responses={200: {"model": EventsResponse}},
+    )
+    async def get_events(session_id: SessionId) -> Response:
         """Get events for a session.
 
         Args:
@@ -120,23 +303,63 @@ def create_app(session_manager: SessionManager | None = None) -> FastAPI:
         Returns:
             List of events
         """
-        manager = _check_session_manager(session_manager)
-        events = manager.get_events(session_id)
-        return EventsResponse(events=events)
+        return _events_response(await manager.get_events(session_id))
+
+    @app.get(
+        "/sessions/{session_id}/events/stream",
+        response_class=StreamingResponse,
+        responses={
+            200: {
+                "content": {"application/x-ndjson": {}},
+                "description": "One EventResponse JSON object per line",
+            }
+        },
+    )
+    async def stream_events(session_id: SessionId) -> StreamingResponse:
+        """Stream events for a session as newline-delimited JSON.
+
+        Events are fetched before the response starts, so recorder errors are
+        still reported as regular HTTP errors.
+
+        Args:
+            session_id: ID of the session
 
-    @app.get("/sessions")
-    def list_sessions() -> SessionsResponse:
+        Returns:
+            Streaming response with one event per line
+        """
+        events = await manager.get_events(session_id)
+        return StreamingResponse(
+            _ndjson_chunks(events), media_type="application/x-ndjson"
+        )
+
+    @app.get(
+        "/sessions",
+        response_model=None,
+        responses={200: {"model": SessionsResponse}},
+    )
+    async def list_sessions() -> Response:
         """List all sessions.
 
         Returns:
             List of sessions
         """
-        manager = _check_session_manager(session_manager)
-        sessions = manager.list_sessions()
-        return SessionsResponse(sessions=sessions)
-
-    @app.get("/sessions/{session_id}")
-    def get_session(session_id: str) -> SessionResponse:
+        sessions = await manager.list_sessions()
+        session_id_str = manager.session_id_str
+        return _json_response(
+            {
+                "sessions": [
+                    {"id": session_id_str(session), "name": session.name}
+                    for session in sessions
+                ]
+            }
+        )
+
+    @app.get(
+        "/sessions/{session_id}",
+        response_model=None,
+        responses={200: {"model": SessionResponse}},
+    )
+    async def get_session(session_id: SessionId) -> Response:
         """Get a specific session.
 
         Args:
@@ -148,11 +371,10 @@ def create_app(session_manager: SessionManager | None = None) -> FastAPI:
         Raises:
             HTTPException: If session not found
         """
-        manager = _check_session_manager(session_manager)
-        session = manager.get_session(session_id)
+        session = await manager.get_session(session_id)
         if session is None:
             msg = f"Session {session_id} not found"
             raise HTTPException(status_code=404, detail=msg)
-        return session
+        return _json_response(_session_to_dict(manager, session))
 
     return app
@@ -1,32 +1,61 @@
-"""Main entry point for the Input Capture API application."""
+"""Main entry point for the Input Capture API application.
+
+Heavy imports are deferred into the functions below to keep start-up fast.
+"""
 
 import os
+from typing import TYPE_CHECKING
 
-import uvicorn
-from hid_recorder import Recorder
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
-from input_capture_api.api import create_app
-from input_capture_api.session_manager import SessionManager
 
+def create_app_from_env() -> "FastAPI":
+    """Create the FastAPI application configured from the environment.
+
+    Used as the uvicorn application factory, so every worker process builds
+    its own recorder and session manager.
+
+    Returns:
+        Configured FastAPI application
+    """
+    from hid_recorder import Recorder
+
+    from input_capture_api.api import create_app
+    from input_capture_api.session_manager import SessionManager
 
-def main() -> None:
-    """Run the FastAPI application with uvicorn."""
     # Get database path from environment or use default
     db_path = os.getenv("HID_RECORDER_DB_PATH", "./hid_recorder.db")
 
-    # Get host and port from environment or use defaults
-    host = os.getenv("API_HOST", "127.0.0.1")
-    port = int(os.getenv("API_PORT", "8000"))
-
     # Initialize the recorder and session manager
     recorder = Recorder(db_path=db_path)
     session_manager = SessionManager(recorder=recorder)
 
     # Create the FastAPI app
-    app = create_app(session_manager=session_manager)
+    return create_app(session_manager=session_manager)
+
 
-    # Run the server
-    uvicorn.run(app, host=host, port=port)
+def main() -> None:
+    """Run the FastAPI application with uvicorn."""
+    import uvicorn
+
+    # Get host, port and worker count from environment or use defaults
+    host = os.getenv("API_HOST", "127.0.0.1")
+    port = int(os.getenv("API_PORT", "8000"))
+    workers = int(os.getenv("API_WORKERS", "1"))
+
+    # Run the server; uvicorn needs an import string to start workers
+    uvicorn.run(
+        "input_capture_api.main:create_app_from_env",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        timeout_keep_alive=30,
+    )
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 """Session manager for HID recording sessions."""
 
 import asyncio
+import logging
+import time
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from hid_interceptor import HIDInterceptor
@@ -8,8 +11,44 @@ from hid_recorder import EventItem, Recorder, Session
 from ulid import ULID
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from contextlib import AbstractAsyncContextManager
 
+logger = logging.getLogger(__name__)
+
+# Seconds a cached session lookup stays valid without a local write
+_SESSIONS_CACHE_TTL = 1.0
+# Most sessions kept in the get_session cache; the oldest entry is dropped first
+_SESSION_CACHE_MAXSIZE = 1024
+# Seconds to wait before restarting a crashed HIDInterceptor
+_INTERCEPTOR_RESTART_DELAY = 1.0
+
+
+@lru_cache(maxsize=1024)
+def _parse_ulid(session_id: str) -> ULID:
+    """Parse a session ID string into a ULID, caching recent results.
+
+    Args:
+        session_id: Session ID in its canonical string form
+
+    Returns:
+        Parsed ULID
+    """
+    return ULID.from_str(session_id)
+
+
+@lru_cache(maxsize=1024)
+def _format_ulid(ulid_id: ULID) -> str:
+    """Encode a ULID as its canonical string, caching recent results.
+
+    Args:
+        ulid_id: ULID to encode
+
+    Returns:
+        Canonical 26 character string form
+    """
+    return str(ulid_id)
+
 
 class SessionManager:
     """Manages HID recording sessions using hid-recorder with HIDInterceptor."""
@@ -21,17 +60,142 @@ class SessionManager:
             recorder: hid-recorder Recorder instance
         """
         self.recorder = recorder
-        # Maps session_id -> (context_manager, task, stop_event)
+        # Maps session_id -> (context_manager, hook)
         self._sessions: dict[
-            str,
-            tuple[AbstractAsyncContextManager[Any], asyncio.Task[None], asyncio.Event],
+            str, tuple[AbstractAsyncContextManager[Any], Callable[[Any], None]]
         ] = {}
+        # Hooks of the active sessions, fed by a single shared HIDInterceptor.
+        # The list is replaced rather than mutated so dispatch can iterate it safely.
+        self._hooks: list[Callable[[Any], None]] = []
+        self._interceptor_task: asyncio.Task[None] | None = None
+        self._interceptor_stop: asyncio.Event | None = None
+        self._interceptor_lock = asyncio.Lock()
+        self._interceptor_restart: asyncio.Task[None] | None = None
+        # Read caches for session lookups, cleared whenever a session starts or ends.
+        # The generation changes on every invalidation, so lookups that were
+        # already in flight do not store their stale results.
+        self._cache_generation = 0
+        self._sessions_cache: list[Session] | None = None
+        self._cache_deadline = 0.0
+        self._session_cache: dict[str, tuple[float, Session]] = {}
+
+    def _invalidate_session_cache(self) -> None:
+        """Drop cached session lookups after a session starts or ends."""
+        self._cache_generation += 1
+        self._sessions_cache = None
+        self._session_cache.clear()
+
+    def _dispatch(self, event: Any) -> None:  # noqa: ANN401
+        """Forward an input event to the hooks of all active sessions.
+
+        Args:
+            event: Event reported by HIDInterceptor
+        """
+        for hook in self._hooks:
+            hook(event)
+
+    def _interceptor_running(self) -> bool:
+        """Check whether the shared HIDInterceptor task is still alive.
+
+        Returns:
+            True if the interceptor was started and has not finished
+        """
+        return self._interceptor_task is not None and not self._interceptor_task.done()
+
+    async def _start_interceptor(self) -> None:
+        """Start the shared HIDInterceptor and wait until it is ready.
+
+        A previous interceptor task that has crashed is replaced. If startup
+        fails or is cancelled, the new interceptor task is cancelled too, so
+        it never runs unowned.
+
+        Raises:
+            RuntimeError: If HIDInterceptor stops before it is ready
+        """
+        stop_event = asyncio.Event()
+        ready_event = asyncio.Event()
+        interceptor = HIDInterceptor(hooks=[self._dispatch])
+        task = asyncio.create_task(interceptor.run(stop_event, ready_event))
+        ready_task = asyncio.create_task(ready_event.wait())
+        try:
+            await asyncio.wait({task, ready_task}, return_when=asyncio.FIRST_COMPLETED)
+        except BaseException:
+            task.cancel()
+            await asyncio.wait({task})
+            raise
+        finally:
+            ready_task.cancel()
+        if not ready_event.is_set():
+            # The task has already finished; re-raise its startup error, if any
+            await task
+            msg = "HIDInterceptor stopped before it was ready"
+            raise RuntimeError(msg)
+        self._interceptor_task = task
+        self._interceptor_stop = stop_event
+        task.add_done_callback(self._on_interceptor_done)
+
+    def _on_interceptor_done(self, task: asyncio.Task[None]) -> None:
+        """Report an interceptor that ended without being stopped.
+
+        While sessions are still active, a restart is scheduled so that they
+        keep recording.
+
+        Args:
+            task: Finished interceptor task
+        """
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.error("HIDInterceptor crashed", exc_info=error)
+        if task is not self._interceptor_task or (
+            self._interceptor_stop is not None and self._interceptor_stop.is_set()
+        ):
+            # Stopped on purpose or already replaced
+            return
+        if error is None:
+            logger.warning("HIDInterceptor stopped unexpectedly")
+        if self._hooks and self._interceptor_restart is None:
+            self._interceptor_restart = asyncio.create_task(self._restart_interceptor())
+
+    async def _restart_interceptor(self) -> None:
+        """Restart HIDInterceptor after a crash if sessions are still active."""
+        try:
+            await asyncio.sleep(_INTERCEPTOR_RESTART_DELAY)
+            async with self._interceptor_lock:
+                if self._hooks and not self._interceptor_running():
+                    await self._start_interceptor()
+        except Exception:
+            logger.exception("Failed to restart HIDInterceptor")
+        finally:
+            self._interceptor_restart = None
+
+    async def _stop_interceptor(self) -> None:
+        """Stop the shared HIDInterceptor and any pending restart.
+
+        Errors the interceptor ended with are logged by its done callback
+        rather than raised here.
+        """
+        if self._interceptor_restart is not None:
+            self._interceptor_restart.cancel()
+        if self._interceptor_task is None or self._interceptor_stop is None:
+            return
+        try:
+            self._interceptor_stop.set()
+            await asyncio.wait({self._interceptor_task})
+        finally:
+            self._interceptor_task = None
+            self._interceptor_stop = None
 
     async def start_session(
         self, name: str, metadata: dict[str, Any] | None = None
     ) -> Session:
         """Start a new recording session with HIDInterceptor.
 
+        The first active session starts the shared HIDInterceptor; later
+        sessions only register their hook with it. An interceptor that has
+        crashed and not been restarted yet is started again.
+
         Args:
             name: Name of the session
             metadata: Optional metadata for the session
@@ -42,69 +206,127 @@ class SessionManager:
         # Manually manage the async context manager
         ctx = self.recorder.session(name=name, metadata=metadata)
         handle = await ctx.__aenter__()
+        session = handle.session
+        self._invalidate_session_cache()
 
-        # Start HIDInterceptor in background
-        stop_event = asyncio.Event()
-        ready_event = asyncio.Event()
-        interceptor = HIDInterceptor(hooks=[handle.hook])
-        task = asyncio.create_task(interceptor.run(stop_event, ready_event))
+        # Encode the ID once; it keys _sessions and seeds session_id_str
+        session_id = _format_ulid(session.id)
 
-        # Wait for HIDInterceptor to be ready before returning
-        await ready_event.wait()
+        # Register the hook and make sure HIDInterceptor is running
+        try:
+            async with self._interceptor_lock:
+                self._hooks = [*self._hooks, handle.hook]
+                if not self._interceptor_running():
+                    await self._start_interceptor()
+        except BaseException:
+            self._hooks = [h for h in self._hooks if h is not handle.hook]
+            await ctx.__aexit__(None, None, None)
+            self._invalidate_session_cache()
+            raise
 
         # Store session info
-        session_id = str(handle.session.id)
-        self._sessions[session_id] = (ctx, task, stop_event)
+        self._sessions[session_id] = (ctx, handle.hook)
+
+        return session
 
-        return handle.session
+    def session_id_str(self, session: Session) -> str:
+        """Get the string form of a session ID.
+
+        Recently used IDs are served from a bounded cache instead of being
+        encoded again.
+
+        Args:
+            session: Session object
+
+        Returns:
+            Session ID as a string
+        """
+        return _format_ulid(session.id)
 
     async def end_session(self, session_id: str) -> None:
         """End a recording session and stop HIDInterceptor.
 
+        HIDInterceptor keeps running while other sessions are active.
+        The recording context is exited even if stopping HIDInterceptor fails.
+
         Args:
             session_id: ID of the session to end
-        """
-        ulid_id = ULID.from_str(session_id)
-        session_id_str = str(ulid_id)
 
+        Raises:
+            KeyError: If no active session has this ID
+        """
         # Get session info
-        ctx, task, stop_event = self._sessions.pop(session_id_str)
-
-        # Stop HIDInterceptor
-        stop_event.set()
-        await task
+        ctx, hook = self._sessions.pop(session_id)
 
-        # Exit context manager
-        await ctx.__aexit__(None, None, None)
+        try:
+            # Unregister the hook and stop HIDInterceptor after the last session
+            async with self._interceptor_lock:
+                self._hooks = [h for h in self._hooks if h is not hook]
+                if not self._hooks:
+                    await self._stop_interceptor()
+        finally:
+            # Exit context manager
+            await ctx.__aexit__(None, None, None)
+            self._invalidate_session_cache()
 
-    def get_events(self, session_id: str) -> list[EventItem]:
+    async def get_events(self, session_id: str) -> list[EventItem]:
         """Get events for a session.
 
+        The recorder query runs in a worker thread so that it does not block
+        the event loop.
+
         Args:
             session_id: ID of the session
 
         Returns:
             List of events
         """
-        ulid_id = ULID.from_str(session_id)
-        return self.recorder.get_events(ulid_id)
+        ulid_id = _parse_ulid(session_id)
+        return await asyncio.to_thread(self.recorder.get_events, ulid_id)
 
-    def list_sessions(self) -> list[Session]:
+    async def list_sessions(self) -> list[Session]:
         """List all sessions.
 
+        Results are cached for a short time and invalidated when a session
+        starts or ends.
+
         Returns:
             List of sessions
         """
-        return self.recorder.list_sessions()
+        if self._sessions_cache is not None and time.monotonic() < self._cache_deadline:
+            return self._sessions_cache
+        generation = self._cache_generation
+        sessions = await asyncio.to_thread(self.recorder.list_sessions)
+        if generation == self._cache_generation:
+            self._sessions_cache = sessions
+            self._cache_deadline = time.monotonic() + _SESSIONS_CACHE_TTL
+        return sessions
 
-    def get_session(self, session_id: str) -> Session | None:
+    async def get_session(self, session_id: str) -> Session | None:
         """Get a specific session.
 
+        Found sessions are cached the same way as list_sessions, for at most
+        _SESSION_CACHE_MAXSIZE sessions at a time.
+
         Args:
             session_id: ID of the session
 
         Returns:
             Session object or None if not found
         """
-        ulid_id = ULID.from_str(session_id)
-        return self.recorder.get_session(ulid_id)
+        cached = self._session_cache.get(session_id)
+        if cached is not None:
+            if time.monotonic() < cached[0]:
+                return cached[1]
+            del self._session_cache[session_id]
+        ulid_id = _parse_ulid(session_id)
+        generation = self._cache_generation
+        session = await asyncio.to_thread(self.recorder.get_session, ulid_id)
+        if session is not None and generation == self._cache_generation:
+            if len(self._session_cache) >= _SESSION_CACHE_MAXSIZE:
+                del self._session_cache[next(iter(self._session_cache))]
+            self._session_cache[session_id] = (
+                time.monotonic() + _SESSIONS_CACHE_TTL,
+                session,
+            )
+        return session
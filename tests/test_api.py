@@ -1,22 +1,33 @@
 """Tests for API endpoints."""
 
+import json
 from unittest.mock import MagicMock
 
+import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 from hid_recorder import EventItem, Session
 from ulid import ULID
 
-from input_capture_api.api import create_app
+from input_capture_api.api import _ndjson_chunks, create_app
 from input_capture_api.session_manager import SessionManager
 
 EXPECTED_EVENT_COUNT = 2
 EXPECTED_SESSION_COUNT = 2
+GZIP_EVENT_COUNT = 100
+STREAM_EVENT_COUNT = 5000
+
+
+def _mock_session_manager() -> MagicMock:
+    """Create a SessionManager mock that formats session IDs like the real one."""
+    mock_session_manager = MagicMock(spec=SessionManager)
+    mock_session_manager.session_id_str.side_effect = lambda session: str(session.id)
+    return mock_session_manager
 
 
 def test_start_session() -> None:
     """Test POST /sessions endpoint."""
-    mock_session_manager = MagicMock(spec=SessionManager)
+    mock_session_manager = _mock_session_manager()
     session_ulid = ULID()
     mock_session = MagicMock(spec=Session)
     mock_session.id = session_ulid
@@ -37,9 +48,21 @@ def test_start_session() -> None:
     mock_session_manager.start_session.assert_called_once()
 
 
+def test_start_session_rejects_unknown_fields() -> None:
+    """Test POST /sessions endpoint with an unexpected field."""
+    mock_session_manager = _mock_session_manager()
+    app = create_app(session_manager=mock_session_manager)
+    client = TestClient(app)
+
+    response = client.post("/sessions", json={"name": "test-session", "extra": 1})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    mock_session_manager.start_session.assert_not_called()
+
+
 def test_end_session() -> None:
     """Test PATCH /sessions/{session_id} endpoint."""
-    mock_session_manager = MagicMock(spec=SessionManager)
+    mock_session_manager = _mock_session_manager()
     app = create_app(session_manager=mock_session_manager)
     client = TestClient(app)
 
@@ -51,28 +74,50 @@ def test_end_session() -> None:
     mock_session_manager.end_session.assert_called_once_with(session_id)
 
 
+def test_end_session_not_found() -> None:
+    """Test PATCH /sessions/{session_id} endpoint when session is not active."""
+    mock_session_manager = _mock_session_manager()
+    mock_session_manager.end_session.side_effect = KeyError
+    app = create_app(session_manager=mock_session_manager)
+    client = TestClient(app)
+
+    session_id = str(ULID())
+    response = client.patch(f"/sessions/{session_id}", json={"status": "ended"})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    mock_session_manager.end_session.assert_called_once_with(session_id)
+
+
 def test_end_session_invalid_status() -> None:
     """Test PATCH /sessions/{session_id} endpoint with invalid status."""
-    mock_session_manager = MagicMock(spec=SessionManager)
+    mock_session_manager = _mock_session_manager()
     app = create_app(session_manager=mock_session_manager)
     client = TestClient(app)
 
     session_id = str(ULID())
     response = client.patch(f"/sessions/{session_id}", json={"status": "invalid"})
 
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
     mock_session_manager.end_session.assert_not_called()
 
 
 def test_get_events() -> None:
     """Test GET /sessions/{session_id}/events endpoint."""
-    mock_session_manager = MagicMock(spec=SessionManager)
+    mock_session_manager = _mock_session_manager()
     mock_events = [
         MagicMock(
             spec=EventItem,
+            device="/dev/input/event0",
+            code=30,
+            value=1,
+            timestamp=1234567890.123,
         ),
         MagicMock(
             spec=EventItem,
+            device="/dev/input/event0",
+            code=30,
+            value=0,
+            timestamp=1234567890.456,
         ),
     ]
     mock_session_manager.get_events.return_value = mock_events
@@ -86,12 +131,135 @@ def test_get_events() -> None:
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
     assert len(data["events"]) == EXPECTED_EVENT_COUNT
+    assert data["events"][0] == {
+        "device": "/dev/input/event0",
+        "code": 30,
+        "value": 1,
+        "timestamp": 1234567890.123,
+    }
     mock_session_manager.get_events.assert_called_once_with(session_id)
 
 
+def test_get_events_empty() -> None:
+    """Test GET /sessions/{session_id}/events endpoint with no events."""
+    mock_session_manager = _mock_session_manager()
+    mock_session_manager.get_events.return_value = []
+
+    app = create_app(session_manager=mock_session_manager)
+    client = TestClient(app)
+
+    session_id = str(ULID())
+    response = client.get(f"/sessions/{session_id}/events")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"events": []}
+
+
+def test_get_events_gzip() -> None:
+    """Test that large GET /sessions/{session_id}/events responses are gzipped."""
+    mock_session_manager = _mock_session_manager()
+    mock_session_manager.get_events.return_value = [
+        MagicMock(
+            spec=EventItem,
+            device="/dev/input/event0",
+            code=30,
+            value=i % 2,
+            timestamp=1234567890.0 + i,
+        )
+        for i in range(GZIP_EVENT_COUNT)
+    ]
+
+    app = create_app(session_manager=mock_session_manager)
+    client = TestClient(app)
+
+    session_id = str(ULID())
+    response = client.get(
+        f"/sessions/{session_id}/events", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["events"]) == GZIP_EVENT_COUNT
+
+
+def test_stream_events() -> None:
+    """Test GET /sessions/{session_id}/events/stream endpoint."""
+    mock_session_manager = _mock_session_manager()
+    mock_events = [
+        MagicMock(
+            spec=EventItem,
+            device="/dev/input/event0",
+            code=30,
+            value=1,
+            timestamp=1234567890.123,
+        ),
+        MagicMock(
+            spec=EventItem,
+            device="/dev/input/event0",
+            code=30,
+            value=0,
+            timestamp=1234567890.456,
+        ),
+    ]
+    mock_session_manager.get_events.return_value = mock_events
+
+    app = create_app(session_manager=mock_session_manager)
+    client = TestClient(app)
+
+    session_id = str(ULID())
+    response = client.get(f"/sessions/{session_id}/events/stream")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == EXPECTED_EVENT_COUNT
+    assert lines[1] == {
+        "device": "/dev/input/event0",
+        "code": 30,
+        "value": 0,
+        "timestamp": 1234567890.456,
+    }
+    mock_session_manager.get_events.assert_called_once_with(session_id)
+
+
+@pytest.mark.asyncio
+async def test_stream_events_chunked() -> None:
+    """Test that streamed events are grouped into chunks of whole lines."""
+    events = [
+        MagicMock(
+            spec=EventItem,
+            device="/dev/input/event0",
+            code=30,
+            value=i % 2,
+            timestamp=1234567890.0 + i,
+        )
+        for i in range(STREAM_EVENT_COUNT)
+    ]
+
+    chunks = [chunk async for chunk in _ndjson_chunks(events)]
+
+    assert 1 < len(chunks) < STREAM_EVENT_COUNT
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+    assert b"".join(chunks).count(b"\n") == STREAM_EVENT_COUNT
+
+
+def test_stream_events_recorder_error() -> None:
+    """Test that recorder errors are reported before streaming starts."""
+    mock_session_manager = _mock_session_manager()
+    mock_session_manager.get_events.side_effect = OSError("database is locked")
+
+    app = create_app(session_manager=mock_session_manager)
+    client = TestClient(app, raise_server_exceptions=False)
+
+    session_id = str(ULID())
+    response = client.get(f"/sessions/{session_id}/events/stream")
+
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
 def test_list_sessions() -> None:
     """Test GET /sessions endpoint."""
-    mock_session_manager = MagicMock(spec=SessionManager)
+    mock_session_manager = _mock_session_manager()
     session_1 = MagicMock(spec=Session)
     session_1.id = ULID()
     session_1.name = "session-1"
@@ -109,12 +277,25 @@ def test_list_sessions() -> None:
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
     assert len(data["sessions"]) == EXPECTED_SESSION_COUNT
+    assert data["sessions"][0] == {"id": str(session_1.id), "name": "session-1"}
     mock_session_manager.list_sessions.assert_called_once()
 
 
+def test_list_sessions_openapi_schema() -> None:
+    """Test that GET /sessions still documents SessionsResponse."""
+    app = create_app(session_manager=_mock_session_manager())
+
+    schema = app.openapi()
+
+    response_schema = schema["paths"]["/sessions"]["get"]["responses"]["200"]
+    assert response_schema["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/SessionsResponse"
+    }
+
+
 def test_get_session() -> None:
     """Test GET /sessions/{session_id} endpoint."""
-    mock_session_manager = MagicMock(spec=SessionManager)
+    mock_session_manager = _mock_session_manager()
     session_ulid = ULID()
     mock_session = MagicMock(spec=Session)
     mock_session.id = session_ulid
@@ -136,7 +317,7 @@ def test_get_session() -> None:
 
 def test_get_session_not_found() -> None:
     """Test GET /sessions/{session_id} endpoint when session not found."""
-    mock_session_manager = MagicMock(spec=SessionManager)
+    mock_session_manager = _mock_session_manager()
     mock_session_manager.get_session.return_value = None
 
     app = create_app(session_manager=mock_session_manager)
@@ -149,6 +330,19 @@ def test_get_session_not_found() -> None:
     mock_session_manager.get_session.assert_called_once_with(session_id)
 
 
+def test_invalid_session_id() -> None:
+    """Test that malformed session IDs are rejected before the endpoint runs."""
+    mock_session_manager = _mock_session_manager()
+    app = create_app(session_manager=mock_session_manager)
+    client = TestClient(app)
+
+    for session_id in ("not-a-ulid", str(ULID()).lower(), "8" + str(ULID())[1:]):
+        response = client.get(f"/sessions/{session_id}")
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    mock_session_manager.get_session.assert_not_called()
+
+
 def test_session_manager_not_configured() -> None:
     """Test that endpoints return 500 when SessionManager is not configured."""
     app = create_app(session_manager=None)
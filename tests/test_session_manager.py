@@ -1,6 +1,7 @@
 """Tests for session manager."""
 
 import asyncio
+import threading
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -12,6 +13,8 @@ from input_capture_api.session_manager import SessionManager
 
 EXPECTED_EVENT_COUNT = 2
 EXPECTED_SESSION_COUNT = 2
+EXPECTED_RECORDER_CALL_COUNT = 2
+EXPECTED_RUN_COUNT = 2
 
 
 @pytest.fixture
@@ -34,6 +37,26 @@ def mock_hid_interceptor(mocker: MockerFixture) -> MagicMock:
     return mock_interceptor
 
 
+def _mock_session_context(name: str = "test-session") -> AsyncMock:
+    """Create a mock of the recorder's session context manager.
+
+    Args:
+        name: Name of the mocked session
+
+    Returns:
+        Context manager whose __aenter__ yields a handle with a session and hook
+    """
+    mock_session = MagicMock(spec=Session)
+    mock_session.id = ULID()
+    mock_session.name = name
+    mock_handle = MagicMock()
+    mock_handle.session = mock_session
+    mock_handle.hook = MagicMock()
+    mock_ctx = AsyncMock()
+    mock_ctx.__aenter__.return_value = mock_handle
+    return mock_ctx
+
+
 @pytest.mark.asyncio
 @pytest.mark.usefixtures("mock_hid_interceptor")
 async def test_start_session() -> None:
@@ -65,6 +88,8 @@ async def test_start_session() -> None:
     assert session.name == "test-session"
     # Verify background task was created
     assert str(session_ulid) in session_manager._sessions  # noqa: SLF001
+    # Verify the string form of the ID is reused
+    assert session_manager.session_id_str(session) == str(session_ulid)
 
 
 @pytest.mark.asyncio
@@ -102,7 +127,177 @@ async def test_end_session() -> None:
     assert session_id not in session_manager._sessions  # noqa: SLF001
 
 
-def test_get_events() -> None:
+@pytest.mark.asyncio
+async def test_end_session_not_found() -> None:
+    """Test ending a session that is not active."""
+    mock_recorder = MagicMock(spec=Recorder)
+    session_manager = SessionManager(recorder=mock_recorder)
+
+    with pytest.raises(KeyError):
+        await session_manager.end_session(str(ULID()))
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_interceptor(mock_hid_interceptor: MagicMock) -> None:
+    """Test that concurrent sessions are fed by a single HIDInterceptor."""
+    mock_recorder = MagicMock(spec=Recorder)
+    mock_ctxs = [_mock_session_context(name) for name in ("session-1", "session-2")]
+    mock_recorder.session.side_effect = mock_ctxs
+
+    session_manager = SessionManager(recorder=mock_recorder)
+    session_1 = await session_manager.start_session(name="session-1")
+    session_2 = await session_manager.start_session(name="session-2")
+
+    mock_hid_interceptor.run.assert_called_once()
+
+    # Events reach the hooks of every active session
+    session_manager._dispatch("event")  # noqa: SLF001
+    for mock_ctx in mock_ctxs:
+        mock_ctx.__aenter__.return_value.hook.assert_called_once_with("event")
+
+    # The interceptor keeps running until the last session ends
+    await session_manager.end_session(str(session_1.id))
+    assert session_manager._interceptor_task is not None  # noqa: SLF001
+    await session_manager.end_session(str(session_2.id))
+    assert session_manager._interceptor_task is None  # noqa: SLF001
+
+
+async def _crash_after_ready(
+    stop_event: asyncio.Event,  # noqa: ARG001
+    ready_event: asyncio.Event | None = None,
+) -> None:
+    """Stand in for a HIDInterceptor run that fails once it is ready.
+
+    Raises:
+        OSError: Always, after setting ready_event
+    """
+    if ready_event is not None:
+        ready_event.set()
+    await asyncio.sleep(0)
+    msg = "device disconnected"
+    raise OSError(msg)
+
+
+@pytest.mark.asyncio
+async def test_crashed_interceptor_is_restarted(
+    mock_hid_interceptor: MagicMock,
+    mocker: MockerFixture,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that an interceptor crash is logged and active sessions keep recording."""
+    mocker.patch("input_capture_api.session_manager._INTERCEPTOR_RESTART_DELAY", 0)
+    mock_recorder = MagicMock(spec=Recorder)
+    mock_ctx = _mock_session_context()
+    mock_recorder.session.return_value = mock_ctx
+    run_normally = mock_hid_interceptor.run.side_effect
+
+    # Only the first interceptor crashes
+    async def run(
+        stop_event: asyncio.Event, ready_event: asyncio.Event | None = None
+    ) -> None:
+        if mock_hid_interceptor.run.call_count == 1:
+            await _crash_after_ready(stop_event, ready_event)
+        else:
+            await run_normally(stop_event, ready_event)
+
+    mock_hid_interceptor.run.side_effect = run
+
+    session_manager = SessionManager(recorder=mock_recorder)
+    session = await session_manager.start_session(name="test-session")
+    crashed_task = session_manager._interceptor_task  # noqa: SLF001
+    assert crashed_task is not None
+    await asyncio.wait({crashed_task})
+    restart = session_manager._interceptor_restart  # noqa: SLF001
+    assert restart is not None
+    await restart
+
+    assert "HIDInterceptor crashed" in caplog.text
+    assert mock_hid_interceptor.run.call_count == EXPECTED_RUN_COUNT
+    session_manager._dispatch("event")  # noqa: SLF001
+    mock_ctx.__aenter__.return_value.hook.assert_called_once_with("event")
+
+    await session_manager.end_session(str(session.id))
+    assert session_manager._interceptor_task is None  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_end_session_after_interceptor_crash(
+    mock_hid_interceptor: MagicMock,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that ending the last session cleans up after a crashed interceptor."""
+    mock_recorder = MagicMock(spec=Recorder)
+    mock_ctx = _mock_session_context()
+    mock_recorder.session.return_value = mock_ctx
+    mock_hid_interceptor.run.side_effect = _crash_after_ready
+
+    session_manager = SessionManager(recorder=mock_recorder)
+    session = await session_manager.start_session(name="test-session")
+    crashed_task = session_manager._interceptor_task  # noqa: SLF001
+    assert crashed_task is not None
+    await asyncio.wait({crashed_task})
+
+    # The pending restart is cancelled along with the session
+    await session_manager.end_session(str(session.id))
+    await asyncio.sleep(0)
+
+    assert "HIDInterceptor crashed" in caplog.text
+    mock_ctx.__aexit__.assert_awaited_once()
+    mock_hid_interceptor.run.assert_called_once()
+    assert session_manager._interceptor_task is None  # noqa: SLF001
+    assert session_manager._interceptor_restart is None  # noqa: SLF001
+    assert not session_manager._sessions  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_start_session_cancelled_during_startup(
+    mock_hid_interceptor: MagicMock,
+) -> None:
+    """Test that cancelling start_session also stops the starting interceptor."""
+    mock_recorder = MagicMock(spec=Recorder)
+    mock_ctxs = [_mock_session_context(name) for name in ("session-1", "session-2")]
+    mock_recorder.session.side_effect = mock_ctxs
+    run_normally = mock_hid_interceptor.run.side_effect
+    starting = asyncio.Event()
+    running: set[int] = set()
+
+    # The first interceptor never becomes ready
+    async def run(
+        stop_event: asyncio.Event, ready_event: asyncio.Event | None = None
+    ) -> None:
+        call = mock_hid_interceptor.run.call_count
+        running.add(call)
+        try:
+            if call == 1:
+                starting.set()
+                await stop_event.wait()
+            else:
+                await run_normally(stop_event, ready_event)
+        finally:
+            running.discard(call)
+
+    mock_hid_interceptor.run.side_effect = run
+
+    session_manager = SessionManager(recorder=mock_recorder)
+    start = asyncio.create_task(session_manager.start_session(name="session-1"))
+    await starting.wait()
+    start.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await start
+
+    assert not running
+    assert session_manager._interceptor_task is None  # noqa: SLF001
+    assert not session_manager._hooks  # noqa: SLF001
+    mock_ctxs[0].__aexit__.assert_awaited_once()
+
+    session = await session_manager.start_session(name="session-2")
+    assert running == {EXPECTED_RUN_COUNT}
+    await session_manager.end_session(str(session.id))
+    assert not running
+
+
+@pytest.mark.asyncio
+async def test_get_events() -> None:
     """Test retrieving events for a session."""
     mock_recorder = MagicMock(spec=Recorder)
     mock_events = [
@@ -113,7 +308,7 @@ def test_get_events() -> None:
 
     session_manager = SessionManager(recorder=mock_recorder)
     session_id = str(ULID())
-    events = session_manager.get_events(session_id)
+    events = await session_manager.get_events(session_id)
 
     mock_recorder.get_events.assert_called_once()
     called_ulid = mock_recorder.get_events.call_args[0][0]
@@ -122,7 +317,8 @@ def test_get_events() -> None:
     assert events == mock_events
 
 
-def test_list_sessions() -> None:
+@pytest.mark.asyncio
+async def test_list_sessions() -> None:
     """Test listing all sessions."""
     mock_recorder = MagicMock(spec=Recorder)
     mock_session_1 = MagicMock(spec=Session)
@@ -135,14 +331,15 @@ def test_list_sessions() -> None:
     mock_recorder.list_sessions.return_value = mock_sessions
 
     session_manager = SessionManager(recorder=mock_recorder)
-    sessions = session_manager.list_sessions()
+    sessions = await session_manager.list_sessions()
 
     mock_recorder.list_sessions.assert_called_once()
     assert len(sessions) == EXPECTED_SESSION_COUNT
     assert sessions == mock_sessions
 
 
-def test_get_session() -> None:
+@pytest.mark.asyncio
+async def test_get_session() -> None:
     """Test getting a specific session."""
     mock_recorder = MagicMock(spec=Recorder)
     session_ulid = ULID()
@@ -153,7 +350,7 @@ def test_get_session() -> None:
 
     session_manager = SessionManager(recorder=mock_recorder)
     session_id = str(session_ulid)
-    session = session_manager.get_session(session_id)
+    session = await session_manager.get_session(session_id)
 
     mock_recorder.get_session.assert_called_once()
     called_ulid = mock_recorder.get_session.call_args[0][0]
@@ -161,3 +358,123 @@ def test_get_session() -> None:
     assert session is not None
     assert session.id == session_ulid
     assert session.name == "test-session"
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_hid_interceptor")
+async def test_list_sessions_is_cached_until_session_starts() -> None:
+    """Test that list_sessions is served from cache until a session starts."""
+    mock_recorder = MagicMock(spec=Recorder)
+    mock_recorder.list_sessions.return_value = []
+    mock_recorder.session.return_value = _mock_session_context()
+
+    session_manager = SessionManager(recorder=mock_recorder)
+    await session_manager.list_sessions()
+    await session_manager.list_sessions()
+    mock_recorder.list_sessions.assert_called_once()
+
+    await session_manager.start_session(name="test-session", metadata=None)
+    await session_manager.list_sessions()
+    assert mock_recorder.list_sessions.call_count == EXPECTED_RECORDER_CALL_COUNT
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_hid_interceptor")
+async def test_list_sessions_in_flight_result_not_cached_after_start() -> None:
+    """Test that a lookup racing with start_session does not cache stale data."""
+    mock_recorder = MagicMock(spec=Recorder)
+    mock_ctx = _mock_session_context()
+    mock_recorder.session.return_value = mock_ctx
+    mock_session = mock_ctx.__aenter__.return_value.session
+
+    fetch_started = threading.Event()
+    release_fetch = threading.Event()
+
+    def list_sessions() -> list[Session]:
+        # The first lookup blocks until the session has started
+        if not fetch_started.is_set():
+            fetch_started.set()
+            release_fetch.wait()
+            return []
+        return [mock_session]
+
+    mock_recorder.list_sessions.side_effect = list_sessions
+
+    session_manager = SessionManager(recorder=mock_recorder)
+    in_flight = asyncio.create_task(session_manager.list_sessions())
+    await asyncio.to_thread(fetch_started.wait)
+
+    await session_manager.start_session(name="test-session", metadata=None)
+    release_fetch.set()
+
+    assert await in_flight == []
+    assert await session_manager.list_sessions() == [mock_session]
+
+
+@pytest.mark.asyncio
+async def test_get_session_is_cached() -> None:
+    """Test that repeated get_session calls hit the recorder once."""
+    mock_recorder = MagicMock(spec=Recorder)
+    session_ulid = ULID()
+    mock_session = MagicMock(spec=Session)
+    mock_session.id = session_ulid
+    mock_recorder.get_session.return_value = mock_session
+
+    session_manager = SessionManager(recorder=mock_recorder)
+    session_id = str(session_ulid)
+    first = await session_manager.get_session(session_id)
+    second = await session_manager.get_session(session_id)
+
+    mock_recorder.get_session.assert_called_once()
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_get_session_cache_is_bounded(mocker: MockerFixture) -> None:
+    """Test that the get_session cache drops its oldest entry when full."""
+    mocker.patch("input_capture_api.session_manager._SESSION_CACHE_MAXSIZE", 2)
+    mock_recorder = MagicMock(spec=Recorder)
+    mock_recorder.get_session.side_effect = lambda ulid_id: MagicMock(
+        spec=Session, id=ulid_id
+    )
+
+    session_manager = SessionManager(recorder=mock_recorder)
+    session_ids = [str(ULID()) for _ in range(3)]
+    for session_id in session_ids:
+        await session_manager.get_session(session_id)
+
+    assert list(session_manager._session_cache) == session_ids[1:]  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_get_session_drops_expired_entry(mocker: MockerFixture) -> None:
+    """Test that an expired get_session entry is removed when it is looked up."""
+    mocker.patch("input_capture_api.session_manager._SESSIONS_CACHE_TTL", 0)
+    mock_recorder = MagicMock(spec=Recorder)
+    session_ulid = ULID()
+    mock_session = MagicMock(spec=Session)
+    mock_session.id = session_ulid
+    mock_recorder.get_session.side_effect = [mock_session, None]
+
+    session_manager = SessionManager(recorder=mock_recorder)
+    session_id = str(session_ulid)
+    await session_manager.get_session(session_id)
+    assert session_id in session_manager._session_cache  # noqa: SLF001
+
+    assert await session_manager.get_session(session_id) is None
+    assert session_id not in session_manager._session_cache  # noqa: SLF001
+
+
+def test_session_id_str() -> None:
+    """Test that session IDs are encoded once and then reused."""
+    mock_recorder = MagicMock(spec=Recorder)
+    session_ulid = ULID()
+    mock_session = MagicMock(spec=Session)
+    mock_session.id = session_ulid
+
+    session_manager = SessionManager(recorder=mock_recorder)
+    first = session_manager.session_id_str(mock_session)
+    second = session_manager.session_id_str(mock_session)
+
+    assert first == str(session_ulid)
+    assert first is second